@@ -167,13 +167,13 @@ class GradeDistFromStudentModuleMixin(object):
             yield (record.module_id, record.course_id), (record.grade, record.max_grade)
 
     def reducer_yield(self, reducer_key, histogram):
-        for k in histogram:
+        for k, count in histogram.items():
             yield [
                 reducer_key[0],  # module_id
                 reducer_key[1],  # course_id
                 k[0] if k[0] != "NULL" else None,  # grade, converting "NULL" -> None
                 k[1] if k[1] != "NULL" else None,  # max_grade, converting "NULL" -> None
-                histogram[k],  # count
+                count,
             ]
 
     def output(self):
@@ -249,11 +249,11 @@ class SeqOpenDistFromStudentModuleMixin(object):
             yield (record.module_id, record.course_id), record.module_id  # values should all be identical per key
 
     def reducer_yield(self, reducer_key, histogram):
-        for k in histogram:
+        for count in histogram.values():
             yield [
                 reducer_key[0],  # module_id
                 reducer_key[1],  # course_id
-                histogram[k],  # count
+                count,
             ]
 
     def output(self):
@@ -0,0 +1,44 @@
+"""Test histogram distributions computed from courseware_studentmodule"""
+
+from unittest import TestCase
+
+from edx.analytics.tasks.common.tests.map_reduce_mixins import ReducerTestMixin
+from edx.analytics.tasks.data_api.studentmodule_dist import (
+    GradeDistFromSqoopToTSVWorkflow, SeqOpenDistFromSqoopToTSVWorkflow
+)
+
+
+class GradeDistReducerTest(ReducerTestMixin, TestCase):
+    """Test the reducer for the grade distribution."""
+
+    task_class = GradeDistFromSqoopToTSVWorkflow
+    MODULE_ID = 'i4x://foo/bar/problem/baz'
+
+    def setUp(self):
+        super(GradeDistReducerTest, self).setUp()
+        self.reduce_key = (self.MODULE_ID, self.COURSE_ID)
+
+    def test_grade_counts(self):
+        inputs = [('1', '2'), ('2', '2'), ('1', '2'), ('NULL', 'NULL')]
+        # The histogram is unordered, so compare the rows as a set.
+        output = set(tuple(row) for row in self._get_reducer_output(inputs))
+        self.assertEquals(output, {
+            (self.MODULE_ID, self.COURSE_ID, '1', '2', 2),
+            (self.MODULE_ID, self.COURSE_ID, '2', '2', 1),
+            (self.MODULE_ID, self.COURSE_ID, None, None, 1),
+        })
+
+
+class SeqOpenDistReducerTest(ReducerTestMixin, TestCase):
+    """Test the reducer for the sequential open distribution."""
+
+    task_class = SeqOpenDistFromSqoopToTSVWorkflow
+    MODULE_ID = 'i4x://foo/bar/sequential/baz'
+
+    def setUp(self):
+        super(SeqOpenDistReducerTest, self).setUp()
+        self.reduce_key = (self.MODULE_ID, self.COURSE_ID)
+
+    def test_open_count(self):
+        inputs = [self.MODULE_ID] * 3
+        self._check_output_complete_tuple(inputs, ([self.MODULE_ID, self.COURSE_ID, 3],))
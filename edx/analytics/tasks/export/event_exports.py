@@ -80,7 +80,8 @@ class EventExportTask(EventLogSelectionMixin, MultiOutputMapReduceJobTask):
             if self.gpg_master_key is not None:
                 self.recipients_for_org_id[org_id].add(self.gpg_master_key)
 
-            self.courses_for_org_id[org_id] = org_config.get('courses')
+            courses = org_config.get('courses')
+            self.courses_for_org_id[org_id] = frozenset(courses) if courses else None
 
             for alias in aliases:
                 self.org_id_whitelist.add(alias)
@@ -111,21 +112,31 @@ class EventExportTask(EventLogSelectionMixin, MultiOutputMapReduceJobTask):
         # Check to see if the org_id is one that should be grouped with other org_ids.
         org_ids = self.primary_org_ids_for_org_id[org_id]
 
-        for key_org_id in org_ids:
-            key = (date_string, key_org_id)
+        # Enforce a standard encoding for the parts of the key. Without this a part of the key
+        # might appear differently in the key string when it is coerced to a string by luigi. For example,
+        # if the same org_id appears in two different records, one as a str() type and the other a
+        # unicode() then without this change they would appear as u'FooX' and 'FooX' in the final key
+        # string. Although python doesn't care about this difference, hadoop does, and will bucket the
+        # values separately. Which is not what we want.
+        # The date and the output line are the same for every org_id, so only prepare them once.
+        encoded_date_string = date_string.encode('utf8')
+        output_line = line.strip()
+        # The course_id is only needed for orgs restricted to some courses, and may legitimately be None,
+        # so track separately whether it has been looked up yet.
+        course_id = None
+        course_id_looked_up = False
 
+        for key_org_id in org_ids:
             # Include only requested courses
             requested_courses = self.courses_for_org_id.get(key_org_id)
-            if requested_courses and eventlog.get_course_id(event, from_url=True) not in requested_courses:
-                continue
-
-            # Enforce a standard encoding for the parts of the key. Without this a part of the key
-            # might appear differently in the key string when it is coerced to a string by luigi. For example,
-            # if the same org_id appears in two different records, one as a str() type and the other a
-            # unicode() then without this change they would appear as u'FooX' and 'FooX' in the final key
-            # string. Although python doesn't care about this difference, hadoop does, and will bucket the
-            # values separately. Which is not what we want.
-            yield tuple([value.encode('utf8') for value in key]), line.strip()
+            if requested_courses:
+                if not course_id_looked_up:
+                    course_id = eventlog.get_course_id(event, from_url=True)
+                    course_id_looked_up = True
+                if course_id not in requested_courses:
+                    continue
+
+            yield (encoded_date_string, key_org_id.encode('utf8')), output_line
 
     def get_event_time(self, event):
         # Some events may emitted and stored for quite some time before actually being entered into the tracking logs.
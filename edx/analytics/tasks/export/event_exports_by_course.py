@@ -25,6 +25,13 @@ class EventExportByCourseTask(EventLogSelectionMixin, MultiOutputMapReduceJobTas
 
     course = luigi.ListParameter(default=[])
 
+    filename_safe_course_ids = None
+
+    def init_local(self):
+        super(EventExportByCourseTask, self).init_local()
+        # Membership is tested for every event, so use a set rather than the parameter's tuple.
+        self.course_set = frozenset(self.course)
+
     def mapper(self, line):
         event, date_string = self.get_event_and_date_string(line) or (None, None)
         if event is None:
@@ -35,7 +42,7 @@ class EventExportByCourseTask(EventLogSelectionMixin, MultiOutputMapReduceJobTas
         if course_id is None:
             return
 
-        if self.course and course_id not in self.course:
+        if self.course_set and course_id not in self.course_set:
             return
 
         key = (date_string, course_id)
@@ -55,7 +62,14 @@ class EventExportByCourseTask(EventLogSelectionMixin, MultiOutputMapReduceJobTas
 
     def output_path_for_key(self, key):
         date, course_id = key
-        filename_safe_course_id = opaque_key_util.get_filename_safe_course_id(course_id)
+
+        # Every course has one output file per day, so only compute its filename-safe form once.
+        if self.filename_safe_course_ids is None:
+            self.filename_safe_course_ids = {}
+        filename_safe_course_id = self.filename_safe_course_ids.get(course_id)
+        if filename_safe_course_id is None:
+            filename_safe_course_id = opaque_key_util.get_filename_safe_course_id(course_id)
+            self.filename_safe_course_ids[course_id] = filename_safe_course_id
 
         return url_path_join(
             self.output_root,
@@ -3,7 +3,6 @@
 import gzip
 import logging
 import os
-import re
 from collections import defaultdict, namedtuple
 
 import cjson
@@ -16,7 +15,7 @@ from edx.analytics.tasks.util import eventlog
 from edx.analytics.tasks.util.file_util import read_config_file
 from edx.analytics.tasks.util.geolocation import GeolocationMixin
 from edx.analytics.tasks.util.obfuscate_util import (
-    IMPLICIT_EVENT_TYPE_PATTERNS, ObfuscatorDownstreamMixin, ObfuscatorMixin
+    COMPILED_IMPLICIT_EVENT_TYPE_PATTERN, ObfuscatorDownstreamMixin, ObfuscatorMixin
 )
 from edx.analytics.tasks.util.url import ExternalURL, url_path_join
 
@@ -26,6 +25,9 @@ ExplicitEventType = namedtuple("ExplicitEventType", ["event_source", "event_type
 
 REDACTED_USERNAME = 'REDACTED_USERNAME'
 
+# Bound on the number of distinct implicit event_type values whose filtering outcome is remembered.
+MAX_IMPLICIT_EVENT_TYPE_CACHE_SIZE = 100000
+
 
 class ObfuscateCourseEventsTask(ObfuscatorMixin, GeolocationMixin, MultiOutputMapReduceJobTask):
     """
@@ -40,6 +42,9 @@ class ObfuscateCourseEventsTask(ObfuscatorMixin, GeolocationMixin, MultiOutputMa
     )
     dump_root = luigi.Parameter(default=None)
 
+    # Maps implicit event_type values to whether they pass the whitelist.  Created when first needed.
+    implicit_event_type_cache = None
+
     def requires(self):
         filename_safe_course_id = opaque_key_util.get_filename_safe_course_id(self.course)
         event_files_url = url_path_join(self.dump_root, filename_safe_course_id, 'events')
@@ -141,17 +146,29 @@ class ObfuscateCourseEventsTask(ObfuscatorMixin, GeolocationMixin, MultiOutputMa
 
         event_type = event.get('event_type')
 
+        # The same URLs are requested over and over, so remember the outcome for each event_type.
+        cache = self.implicit_event_type_cache
+        if cache is None or len(cache) >= MAX_IMPLICIT_EVENT_TYPE_CACHE_SIZE:
+            cache = self.implicit_event_type_cache = {}
+
+        is_included = cache.get(event_type)
+        if is_included is None:
+            is_included = self._is_included_implicit_event_type(event_type)
+            cache[event_type] = is_included
+
+        if is_included:
+            return event
+
+        return None
+
+    def _is_included_implicit_event_type(self, event_type):
+        """Returns True if the implicit event_type matches one of the whitelist patterns."""
         match = opaque_key_util.COURSE_REGEX.match(event_type)
         if match:
             course_id_string = match.group('course_id')
             event_type = event_type.replace(course_id_string, '(course_id)')
 
-        for included_event_type in IMPLICIT_EVENT_TYPE_PATTERNS:
-            match = re.match(included_event_type, event_type)
-            if match:
-                return event
-
-        return None
+        return COMPILED_IMPLICIT_EVENT_TYPE_PATTERN.match(event_type) is not None
 
     def _get_user_id_as_int(self, user_id):
         """Convert possible str value of user_id to int or None."""
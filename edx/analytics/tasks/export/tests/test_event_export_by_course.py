@@ -67,6 +67,11 @@ class EventExportByCourseMapTest(EventExportByCourseBaseTest):
         line = self.create_event_log_line()
         self.assert_no_map_output_for(line)
 
+    def test_output_for_wanted_event(self):
+        self.create_task(course=['Foo', self.course_id])
+        line = self.create_event_log_line()
+        self.assert_single_map_output(line, self.expected_key, line)
+
 
 class EventExportByCourseLegacyMapTest(InitializeLegacyKeysMixin, EventExportByCourseMapTest):
     """Run same mapper() tests, but using legacy values for keys."""
@@ -85,3 +90,11 @@ class EventExportByCourseOutputPathTest(EventExportByCourseBaseTest):
         self.course_id = str(CourseLocator(org='Foo', course='Bar', run='Baz'))
         path = self.task.output_path_for_key((self.DATE, self.course_id))
         self.assertEquals('/fake/output/Foo_Bar_Baz/events/Foo_Bar_Baz-events-2013-12-17.log.gz', path)
+
+    def test_output_path_for_repeated_course(self):
+        self.course_id = 'Foo/Bar/Baz'
+        first_path = self.task.output_path_for_key((self.DATE, self.course_id))
+        second_path = self.task.output_path_for_key(('2013-12-18', self.course_id))
+        self.assertEquals('/fake/output/Foo_Bar_Baz/events/Foo_Bar_Baz-events-2013-12-17.log.gz', first_path)
+        self.assertEquals('/fake/output/Foo_Bar_Baz/events/Foo_Bar_Baz-events-2013-12-18.log.gz', second_path)
+        self.assertEquals({'Foo/Bar/Baz': 'Foo_Bar_Baz'}, self.task.filename_safe_course_ids)
@@ -14,6 +14,7 @@ from luigi.date_interval import Year
 from mock import MagicMock, patch
 
 from edx.analytics.tasks.export.event_exports import EventExportTask
+from edx.analytics.tasks.util import eventlog
 from edx.analytics.tasks.util.tests.opaque_key_mixins import InitializeOpaqueKeysMixin
 from edx.analytics.tasks.util.tests.target import FakeTarget
 
@@ -503,3 +504,54 @@ class CourseEventExportTestCase(EventExportTestCaseBase):
         combined = list(chain.from_iterable(results.itervalues()))
         for value in non_expected:
             self.assertNotIn(value, combined)
+
+
+class SharedAliasCourseEventExportTestCase(EventExportTestCaseBase):
+    """Tests for EventExportTask when an alias maps to both restricted and unrestricted orgs."""
+
+    CONFIG_DICT = {
+        'organizations': {
+            'FooX': {
+                'recipients': ['automation@foox.com']
+            },
+            'BarX': {
+                'recipients': ['automation@barx.com'],
+                'other_names': ['FooX'],
+                'courses': ['FooX/a/b']
+            },
+            'QuxX': {
+                'recipients': ['automation@quxx.com'],
+                'other_names': ['FooX'],
+                'courses': ['FooX/c/d']
+            },
+        }
+    }
+    CONFIGURATION = yaml.dump(CONFIG_DICT)
+
+    def setUp(self):
+        super(SharedAliasCourseEventExportTestCase, self).setUp()
+        self.task.init_local()
+
+    def get_mapper_org_ids(self, *args):
+        """Run the mapper on a TestEvent built from args and return the org_ids it was exported for."""
+        event_string = json.dumps(TestEvent(*args).data)
+        return [key[1] for key, _value in self.run_mapper_for_server_file(self.SERVER_NAME_1, event_string)]
+
+    def test_courses_for_org_id(self):
+        self.assertEqual(self.task.courses_for_org_id, {
+            'FooX': None,
+            'BarX': frozenset(['FooX/a/b']),
+            'QuxX': frozenset(['FooX/c/d']),
+        })
+
+    def test_matching_course(self):
+        self.assertItemsEqual(self.get_mapper_org_ids('FooX', 'FooX/a/b'), ['FooX', 'BarX'])
+        self.assertItemsEqual(self.get_mapper_org_ids('FooX', None, '/courses/FooX/c/d'), ['FooX', 'QuxX'])
+
+    def test_non_matching_course(self):
+        self.assertItemsEqual(self.get_mapper_org_ids('FooX', 'FooX/e/f'), ['FooX'])
+
+    def test_missing_course_looked_up_once(self):
+        with patch.object(eventlog, 'get_course_id', wraps=eventlog.get_course_id) as mock_get_course_id:
+            self.assertItemsEqual(self.get_mapper_org_ids('FooX'), ['FooX'])
+        self.assertEqual(mock_get_course_id.call_count, 1)
@@ -161,6 +161,14 @@ class EventsObfuscationMapTest(EventsObfuscationBaseTest):
         mapper_output_line = tuple(self.task.mapper(input_line))[0][1]
         self.assertEquals(input_line, mapper_output_line)
 
+    def test_implicit_event_type_caching(self):
+        allowed_type = '/courses/course-v1:edX+DemoX+Demo_Course_2015/info/'
+        discarded_type = '/courses/course-v1:edX+DemoX+Demo_Course_2015/modx'
+        for _ in range(2):
+            self.assertEquals(1, len(tuple(self.task.mapper(self.create_event_log_line(event_type=allowed_type)))))
+            self.assert_no_map_output_for(self.create_event_log_line(event_type=discarded_type))
+        self.assertEquals({allowed_type: True, discarded_type: False}, self.task.implicit_event_type_cache)
+
 
 @ddt
 class EventLineObfuscationTest(EventsObfuscationBaseTest):
@@ -78,7 +78,8 @@ class UserInfoMixin(UserInfoDownstreamMixin):
                 # TODO: Fix ugly hack to get around reading .metadata record information.
                 if line.startswith('{'):
                     line = line.split('}', 2)[1]
-                split_line = line.rstrip('\r\n').split('\x01')
+                # Only the first two fields are used, so leave the rest of the record unsplit.
+                split_line = line.rstrip('\r\n').split('\x01', 2)
                 try:
                     user_id = int(split_line[0])
                 except ValueError:
@@ -105,7 +106,8 @@ class UserInfoMixin(UserInfoDownstreamMixin):
                 # TODO: Fix ugly hack to get around reading .metadata record information.
                 if line.startswith('{'):
                     line = line.split('}', 2)[1]
-                split_line = line.rstrip('\r\n').split('\x01')
+                # Only the first two fields are used, so leave the rest of the record unsplit.
+                split_line = line.rstrip('\r\n').split('\x01', 2)
                 try:
                     user_id = int(split_line[0])
                 except ValueError:
@@ -298,6 +300,11 @@ def find_emails(text, log_context=DEFAULT_LOG_CONTEXT):
 
 def find_username(text, username, log_context=DEFAULT_LOG_CONTEXT):
     """Replaces the provided username value as it appears in text."""
+    # Optimization: most strings in an event do not contain the username at all,
+    # so skip building and applying the pattern when a case-insensitive
+    # substring test already rules out a match.
+    if isinstance(text, unicode) and isinstance(username, unicode) and username.lower() not in text.lower():
+        return text
     username_pattern = re.compile(
         r'\b({})\b'.format(re.escape(username)),
         re.IGNORECASE,
@@ -312,6 +319,9 @@ def find_username(text, username, log_context=DEFAULT_LOG_CONTEXT):
 
 def find_userid(text, user_id, log_context=DEFAULT_LOG_CONTEXT):
     """Replaces the provided user_id value as it appears in text."""
+    # Optimization: skip building and applying the pattern unless the digits appear somewhere in the text.
+    if '{}'.format(user_id) not in text:
+        return text
     userid_pattern = re.compile(
         r'\b({})\b'.format(user_id),
         re.IGNORECASE,
@@ -333,16 +343,26 @@ LEGAL_NAME_PATTERN = re.compile(r"[\w. \-\'\(\)\,\*\"]+$", re.UNICODE)
 # them repeatedly.  Also cuts down on logging noise.
 REJECTED_NAMES = set()
 
+# Cache the compiled pattern for each accepted fullname.  The same user's
+# name is searched for in every string of every one of the user's events,
+# so building the pattern once saves repeating the substitutions and the
+# compile on each call.  The cache is cleared when it grows too large.
+FULLNAME_PATTERNS = {}
+MAX_FULLNAME_PATTERNS = 100000
+
 # People use common words in their names.  Sometimes it's just plain text; sometimes jibberish.
 # It's hard to tell the difference.  (E.g. "The" appears in Vietnamese-like names.)
-STOPWORDS = ['the', 'and', 'can']
+STOPWORDS = frozenset(['the', 'and', 'can'])
 
 
-def find_user_fullname(text, fullname, log_context=DEFAULT_LOG_CONTEXT):
-    """Culls 'fullnames' originally from auth_userprofile.name and replaces them in text."""
+def get_fullname_pattern(fullname):
+    """Returns a compiled pattern matching the given fullname, or None if the fullname is rejected."""
 
     if fullname in REJECTED_NAMES:
-        return text
+        return None
+
+    if fullname in FULLNAME_PATTERNS:
+        return FULLNAME_PATTERNS[fullname]
 
     # Indian names use special abbreviations for "son of"/"daughter of".
     # For the purposes of finding matches, just strip these out.
@@ -361,7 +381,7 @@ def find_user_fullname(text, fullname, log_context=DEFAULT_LOG_CONTEXT):
     if not LEGAL_NAME_PATTERN.match(fullname2):
         log.error(u"Fullname '%r' contains unexpected characters.", fullname)
         REJECTED_NAMES.add(fullname)
-        return text
+        return None
 
     # Strip parentheses and commas and the like, and escape the characters that are
     # legal in names but may have different meanings in regexps (i.e. apostrophe and period).
@@ -382,7 +402,7 @@ def find_user_fullname(text, fullname, log_context=DEFAULT_LOG_CONTEXT):
     if len(names) == 0:
         log.error(u"Fullname '%r' contains only whitespace characters.", fullname)
         REJECTED_NAMES.add(fullname)
-        return text
+        return None
 
     patterns = []
     # add the whole, then add each individual part if it's long enough.
@@ -397,6 +417,20 @@ def find_user_fullname(text, fullname, log_context=DEFAULT_LOG_CONTEXT):
         u'\\b({})\\b'.format(u"|".join(patterns)),
         re.IGNORECASE + re.UNICODE,
     )
+
+    if len(FULLNAME_PATTERNS) >= MAX_FULLNAME_PATTERNS:
+        FULLNAME_PATTERNS.clear()
+    FULLNAME_PATTERNS[fullname] = fullname_pattern
+    return fullname_pattern
+
+
+def find_user_fullname(text, fullname, log_context=DEFAULT_LOG_CONTEXT):
+    """Culls 'fullnames' originally from auth_userprofile.name and replaces them in text."""
+
+    fullname_pattern = get_fullname_pattern(fullname)
+    if fullname_pattern is None:
+        return text
+
     return find_all_matches(fullname_pattern, text, "FULLNAME", log_context)
 
 
@@ -574,9 +608,9 @@ class Obfuscator(object):
             for key in obj.keys():
                 value = obj.get(key)
                 if isinstance(key, str):
-                    new_label = u"{}.{}".format(label, key.decode('utf8'))
+                    new_label = label + u'.' + key.decode('utf8')
                 else:
-                    new_label = u"{}.{}".format(label, key)
+                    new_label = label + u'.' + unicode(key)
                 updated_value = self.obfuscate_structure(value, new_label, user_info, log_context, entities)
                 if updated_value is not None:
                     changed = True
@@ -591,7 +625,7 @@ class Obfuscator(object):
             new_list = []
             changed = False
             for index, value in enumerate(obj):
-                new_label = u"{}[{}]".format(label, index)
+                new_label = label + u'[' + unicode(index) + u']'
                 updated_value = self.obfuscate_structure(value, new_label, user_info, log_context, entities)
                 if updated_value is not None:
                     changed = True
@@ -606,7 +640,7 @@ class Obfuscator(object):
             # First perform backslash decoding on string, if needed.
             if needs_backslash_decoding(obj):
                 decoded_obj = backslash_decode_value(obj)
-                new_label = u"{}*d".format(label)
+                new_label = label + u'*d'
                 updated_value = self.obfuscate_structure(decoded_obj, new_label, user_info, log_context, entities)
                 if updated_value is not None:
                     return backslash_encode_value(updated_value)
@@ -623,7 +657,7 @@ class Obfuscator(object):
                 return None
         elif isinstance(obj, str):
             unicode_obj = obj.decode('utf8')
-            new_label = u"{}*u".format(label)
+            new_label = label + u'*u'
             updated_value = self.obfuscate_structure(unicode_obj, new_label, user_info, log_context, entities)
             if updated_value is not None:
                 return updated_value.encode('utf8')
@@ -660,3 +694,9 @@ IMPLICIT_EVENT_TYPE_PATTERNS = [
     r"^/courses/\(course_id\)/discussion/forum/[\w\-.]+/(inline|search|threads)$",
     r"^/courses/\(course_id\)/discussion/forum/[\w\-.]+/threads/\w+$",
 ]
+
+# Combine the whitelist into a single alternation, so that each event_type is
+# checked with one match() call rather than one call per pattern.
+COMPILED_IMPLICIT_EVENT_TYPE_PATTERN = re.compile(
+    '|'.join('(?:{})'.format(pattern) for pattern in IMPLICIT_EVENT_TYPE_PATTERNS)
+)
@@ -252,6 +252,32 @@ class FindMatchesTestCase(TestCase):
         actual = obfuscate_util.find_username(raw, username)
         self.assertEquals(expected, actual)
 
+    @data(
+        u'some unrelated text',
+        u'a différent user',
+        'ausername',
+    )
+    def test_skip_text_without_username(self, text):
+        raw = self.SIMPLE_CONTEXT.format(text)
+        result = obfuscate_util.find_username(raw, u'username')
+        self.assertEquals(raw, result)
+
+    #####################
+    # userid
+    #####################
+
+    @data(
+        ('user 12345 here', 'user <<USER_ID>> here'),
+        ('user 123456 here', 'user 123456 here'),
+        ('no digits here', 'no digits here'),
+    )
+    @unpack
+    def test_find_userid(self, text, result):
+        raw = self.SIMPLE_CONTEXT.format(text)
+        expected = self.SIMPLE_CONTEXT.format(result)
+        actual = obfuscate_util.find_userid(raw, 12345)
+        self.assertEquals(expected, actual)
+
     #####################
     # fullname
     #####################
@@ -334,6 +360,14 @@ class FindMatchesTestCase(TestCase):
         self.assertEquals(raw, result)
         self.assertTrue(fullname in obfuscate_util.REJECTED_NAMES)
 
+    def test_fullname_pattern_caching(self):
+        pattern = obfuscate_util.get_fullname_pattern(u'First Cached')
+        self.assertTrue(u'First Cached' in obfuscate_util.FULLNAME_PATTERNS)
+        self.assertIs(pattern, obfuscate_util.get_fullname_pattern(u'First Cached'))
+        raw = self.SIMPLE_CONTEXT.format('cached')
+        expected = self.SIMPLE_CONTEXT.format("<<FULLNAME>>")
+        self.assertEquals(expected, obfuscate_util.find_user_fullname(raw, u'First Cached'))
+
 
 @ddt
 class FindMatchLogContextTestCase(TestCase):
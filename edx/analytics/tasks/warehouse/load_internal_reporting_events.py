@@ -447,6 +447,8 @@ class EventRecordClassMixin(object):
         default='EventRecord',
     )
 
+    record_fields = None
+
     def __init__(self, *args, **kwargs):
         super(EventRecordClassMixin, self).__init__(*args, **kwargs)
         module_name = self.__class__.__module__
@@ -458,6 +460,12 @@ class EventRecordClassMixin(object):
     def get_event_record_class(self):
         return self.record_class
 
+    def get_event_record_fields(self):
+        """Return the fields of the event record class, looking them up only once per task."""
+        if self.record_fields is None:
+            self.record_fields = self.record_class.get_fields()
+        return self.record_fields
+
     def uses_JSON_event_record(self):
         return self.event_record_type == 'JsonEventRecord'
 
@@ -484,6 +492,9 @@ class BaseEventRecordDataTask(EventRecordDataDownstreamMixin, MultiOutputMapRedu
     # This is a placeholder.  It is expected to be overridden in derived classes.
     counter_category_name = 'Event Record Exports'
 
+    # Derived from the event mapping when first needed.
+    event_mapping_prefixes = None
+
     # TODO: maintain support for info about events.  We may need something similar to identify events
     # that should -- or should not -- be included in the event dump.
 
@@ -716,15 +727,18 @@ class BaseEventRecordDataTask(EventRecordDataDownstreamMixin, MultiOutputMapRedu
         else:
             event_dict[event_record_key] = obj
 
-    def _add_event_info_recurse(self, event_dict, event_mapping, obj, label):
+    def _add_event_info_recurse(self, event_dict, event_mapping, mapping_prefixes, obj, label):
         if obj is None:
             pass
         elif isinstance(obj, dict):
+            # Nothing below this label is mapped, so don't bother walking it.
+            if label not in mapping_prefixes:
+                return
             for key in obj.keys():
                 new_value = obj.get(key)
                 # Normalize labels to be all lower-case, since all field (column) names are lowercased.
-                new_label = u"{}.{}".format(label, key.lower())
-                self._add_event_info_recurse(event_dict, event_mapping, new_value, new_label)
+                new_label = label + u"." + key.lower()
+                self._add_event_info_recurse(event_dict, event_mapping, mapping_prefixes, new_value, new_label)
         elif isinstance(obj, list):
             # We will not output any values that are stored in lists.
             pass
@@ -734,12 +748,32 @@ class BaseEventRecordDataTask(EventRecordDataDownstreamMixin, MultiOutputMapRedu
                 event_record_key, event_record_field = event_mapping[label]
                 self._add_event_entry(event_dict, event_record_key, event_record_field, label, obj)
 
-    def add_event_info(self, event_dict, event_mapping, event):
-        self._add_event_info_recurse(event_dict, event_mapping, event, 'root')
+    def get_event_mapping_prefixes(self):
+        """
+        Return a frozenset of the labels that have some entry of the event mapping nested beneath them.
+
+        For example, an entry for 'root.event.user_id' contributes 'root' and 'root.event'.  Like the
+        event mapping itself, this is only calculated once per task.
+        """
+        if self.event_mapping_prefixes is None:
+            prefixes = set()
+            for label in self.get_event_mapping():
+                index = label.find('.')
+                while index != -1:
+                    prefixes.add(label[:index])
+                    index = label.find('.', index + 1)
+            self.event_mapping_prefixes = frozenset(prefixes)
+        return self.event_mapping_prefixes
+
+    def add_event_info(self, event_dict, event):
+        # Take both the mapping and its prefixes from the task, so that the pruning always matches the lookups.
+        event_mapping = self.get_event_mapping()
+        mapping_prefixes = self.get_event_mapping_prefixes()
+        self._add_event_info_recurse(event_dict, event_mapping, mapping_prefixes, event, 'root')
 
     def add_calculated_event_entry(self, event_dict, event_record_key, obj):
         """Use this to explicitly add calculated entry values."""
-        event_record_field = self.get_event_record_class().get_fields()[event_record_key]
+        event_record_field = self.get_event_record_fields()[event_record_key]
         label = event_record_key
         self._add_event_entry(event_dict, event_record_key, event_record_field, label, obj)
 
@@ -774,7 +808,7 @@ class TrackingEventRecordDataTask(EventLogSelectionMixin, BaseEventRecordDataTas
         """Return dictionary of event attributes to the output keys they map to."""
         if self.event_mapping is None:
             self.event_mapping = {}
-            fields = self.get_event_record_class().get_fields()
+            fields = self.get_event_record_fields()
             field_keys = fields.keys()
             for field_key in field_keys:
                 field_tuple = (field_key, fields[field_key])
@@ -916,8 +950,7 @@ class TrackingEventRecordDataTask(EventLogSelectionMixin, BaseEventRecordDataTas
             self.add_calculated_event_entry(event_dict, 'event_category', event_category)
             self.add_calculated_event_entry(event_dict, 'context_course_id', course_id)
 
-        event_mapping = self.get_event_mapping()
-        self.add_event_info(event_dict, event_mapping, event)
+        self.add_event_info(event_dict, event)
 
         record = self.get_event_record_class()(**event_dict)
         key = (date_received, project_name)
@@ -1079,7 +1112,7 @@ class SegmentEventRecordDataTask(SegmentEventLogSelectionMixin, BaseEventRecordD
         """Return dictionary of event attributes to the output keys they map to."""
         if self.event_mapping is None:
             self.event_mapping = {}
-            fields = self.get_event_record_class().get_fields()
+            fields = self.get_event_record_fields()
             field_keys = fields.keys()
             for field_key in field_keys:
                 field_tuple = (field_key, fields[field_key])
@@ -1245,8 +1278,7 @@ class SegmentEventRecordDataTask(SegmentEventLogSelectionMixin, BaseEventRecordD
             self.add_calculated_event_entry(event_dict, 'event_source', event_source)
             self.add_calculated_event_entry(event_dict, 'event_category', event_category)
 
-        event_mapping = self.get_event_mapping()
-        self.add_event_info(event_dict, event_mapping, event)
+        self.add_event_info(event_dict, event)
 
         if self.uses_JSON_event_record():
             # Try harder to extract course_id and related information.
@@ -7,6 +7,7 @@ import unittest
 import ciso8601
 import luigi
 from ddt import data, ddt, unpack
+from mock import patch
 
 from edx.analytics.tasks.common.tests.map_reduce_mixins import MapperTestMixin
 from edx.analytics.tasks.util import eventlog
@@ -171,6 +172,30 @@ class TrackingEventRecordTaskMapTest(BaseTrackingEventRecordTaskMapTest, unittes
         expected_value = EventRecord(**expected_dict).to_separated_values()
         self.assert_single_map_output(event, expected_key, expected_value)
 
+    def test_event_mapping_prefixes(self):
+        self.task.event_mapping = {
+            'root.event.user_id': None,
+            'root.context.module.display_name': None,
+        }
+        self.assertEquals(
+            frozenset(['root', 'root.event', 'root.context', 'root.context.module']),
+            self.task.get_event_mapping_prefixes(),
+        )
+
+    def test_unmapped_subtree_ignored(self):
+        event_dict = {}
+        event = {'unmapped': {'nested': {'success': 'correct'}}, 'event': {'success': 'incorrect'}}
+        with patch.object(
+            self.task, '_add_event_info_recurse', wraps=self.task._add_event_info_recurse
+        ) as mock_recurse:
+            self.task.add_event_info(event_dict, event)
+
+        labels = [call_args[0][4] for call_args in mock_recurse.call_args_list]
+        self.assertIn('root.unmapped', labels)
+        self.assertIn('root.event.success', labels)
+        self.assertFalse([label for label in labels if label.startswith('root.unmapped.')])
+        self.assertEquals({'success': 'incorrect'}, event_dict)
+
 
 @ddt
 class TrackingJsonEventRecordTaskMapTest(BaseTrackingEventRecordTaskMapTest, unittest.TestCase):